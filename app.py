@@ -5,8 +5,10 @@ Get nutritional score predictions for dishes based on their nutritional values
 
 import joblib
 import numpy as np
-from config import MODEL_FILE, SCALER_FILE, FEATURES_FILE, DISH_NAME_COLUMN
+import pandas as pd
+from config import MODEL_FILE, SCALER_FILE, FEATURES_FILE, DISH_NAME_COLUMN, NUTRIENT_COLUMNS
 from data_loader import DataLoader
+from nn_index import load_similarity_index
 
 
 def print_header(text):
@@ -128,6 +130,22 @@ def find_matching_dishes(X_input, features, loader, top_n=5):
     return matching_dishes
 
 
+def find_dishes_like(dish_name, index, loader, top_n=5):
+    """Find dishes closest to a dataset dish over the full nutrient vector"""
+    df = loader.df
+    matching = df.index[df[DISH_NAME_COLUMN].str.contains(dish_name, case=False, na=False, regex=False)]
+    
+    if len(matching) == 0:
+        return None, None
+    
+    pos = df.index.get_loc(matching[0])
+    idx, dists = index.query(df[NUTRIENT_COLUMNS].values[pos], k=top_n, exclude=pos)
+    
+    similar = df.iloc[idx].copy()
+    similar['distance'] = dists
+    return df.iloc[pos], similar
+
+
 def main():
     """Main app loop"""
     print_header("NUTRITIONAL SCORE PREDICTION APP")
@@ -146,6 +164,8 @@ def main():
     loader.load()
     loader.prepare_data()
     
+    index = load_similarity_index(loader.df)
+    
     print_section("HOW TO USE")
     print("This app predicts nutritional quality scores (0-100) for dishes.")
     print("Enter the nutritional values for a dish:\n")
@@ -160,11 +180,12 @@ def main():
         print("Options:")
         print("  1. Enter nutritional values manually")
         print("  2. Search for a similar dish in dataset")
-        print("  3. Exit\n")
+        print("  3. Find dishes like a dataset dish")
+        print("  4. Exit\n")
         
-        choice = input("Enter choice (1-3): ").strip()
+        choice = input("Enter choice (1-4): ").strip()
         
-        if choice == '3':
+        if choice == '4':
             print("\n" + "=" * 80)
             print("  Thank you for using the Nutrition Prediction App!")
             print("=" * 80 + "\n")
@@ -186,6 +207,25 @@ def main():
             
             continue
         
+        elif choice == '3':
+            dish_query = input("Enter dish name: ").strip()
+            dish, similar = find_dishes_like(dish_query, index, loader)
+            
+            if dish is None:
+                print(f"\n❌ No dishes found matching '{dish_query}'")
+                continue
+            
+            print(f"\n📋 Dishes like {dish[DISH_NAME_COLUMN]} (all {len(NUTRIENT_COLUMNS)} nutrients):\n")
+            for rank, (idx, row) in enumerate(similar.iterrows(), 1):
+                print(f"  {rank}. {row[DISH_NAME_COLUMN]}")
+                print(f"     ├─ Distance: {row['distance']:.3f}")
+                for nutrient in NUTRIENT_COLUMNS:
+                    value = f"{row[nutrient]:.2f}" if pd.notna(row[nutrient]) else "n/a"
+                    print(f"     ├─ {nutrient}: {value}")
+                print()
+            
+            continue
+        
         elif choice == '1':
             X_input = get_user_input(features)
             
@@ -246,7 +286,7 @@ def main():
                 print("❌ No matching dishes found in dataset")
         
         else:
-            print("❌ Invalid choice. Please enter 1, 2, or 3.")
+            print("❌ Invalid choice. Please enter 1, 2, 3, or 4.")
 
 
 if __name__ == "__main__":
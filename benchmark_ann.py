@@ -0,0 +1,72 @@
+"""
+ANN Benchmark Script
+Compare the product-quantization index against exact nearest-neighbour search
+Run: python benchmark_ann.py
+"""
+
+import time
+import numpy as np
+from data_loader import DataLoader
+from nn_index import NutrientIndex, ExactNutrientIndex
+
+
+def print_header(text):
+    """Print formatted header"""
+    print("\n" + "=" * 80)
+    print(f"  {text}")
+    print("=" * 80)
+
+
+def benchmark(index, exact, X, k_values=(1, 5, 10)):
+    """Measure recall@k and per-query latency over every dish"""
+    n = len(X)
+    results = {}
+
+    for k in k_values:
+        hits = 0
+        exact_time = 0.0
+        ann_time = 0.0
+        for i in range(n):
+            start = time.perf_counter()
+            truth, _ = exact.query(X[i], k=k, exclude=i)
+            exact_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            approx, _ = index.query(X[i], k=k, exclude=i)
+            ann_time += time.perf_counter() - start
+
+            hits += len(np.intersect1d(truth, approx))
+
+        results[k] = {
+            'recall': hits / (n * k),
+            'exact_ms': exact_time / n * 1000,
+            'ann_ms': ann_time / n * 1000,
+        }
+
+    return results
+
+
+def main():
+    """Main execution"""
+    print_header("ANN INDEX BENCHMARK")
+
+    loader = DataLoader()
+    df = loader.load()
+    index = NutrientIndex().fit(df)
+    exact = ExactNutrientIndex().fit(df)
+    X = df[index.columns].values.astype(np.float32)
+
+    exact_bytes = exact.vectors.nbytes
+    print(f"✓ Dishes: {len(X)}, nutrients: {len(index.columns)}")
+    print(f"  ├─ Exact (float32 matrix): {exact_bytes / 1024:.1f} KB")
+    print(f"  └─ PQ (codes + codebooks): {index.memory_bytes() / 1024:.1f} KB "
+          f"({index.codes.nbytes / 1024:.1f} KB codes)")
+
+    print(f"\n{'k':>4} {'recall@k':>10} {'exact ms':>10} {'ann ms':>10}")
+    for k, r in benchmark(index, exact, X).items():
+        print(f"{k:>4} {r['recall']:>10.3f} {r['exact_ms']:>10.4f} {r['ann_ms']:>10.4f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Meal Plan Benchmark Script
+Check the meal-plan search against brute force, then time it across catalog sizes
+Run: python benchmark_meal_plan.py
+"""
+
+import itertools
+import time
+import numpy as np
+from data_loader import DataLoader
+from meal_planner import MealPlanner
+from config import FEATURE_COLUMNS, RANDOM_STATE
+
+
+def print_header(text):
+    """Print formatted header"""
+    print("\n" + "=" * 80)
+    print(f"  {text}")
+    print("=" * 80)
+
+
+def make_catalog(df, size, rng):
+    """Resample the dataset with ±10% jitter to reach the requested size"""
+    catalog = df.sample(size, replace=size > len(df), random_state=int(rng.integers(1 << 31))).reset_index(drop=True)
+    jitter = rng.normal(1.0, 0.1, size=(size, len(FEATURE_COLUMNS))).clip(0.7, 1.3)
+    catalog[FEATURE_COLUMNS] = catalog[FEATURE_COLUMNS].values * jitter
+    return catalog
+
+
+def brute_force(catalog, calories, min_protein, tolerance, min_dishes, max_dishes):
+    """Best average score over every combination that meets the targets"""
+    X = catalog[FEATURE_COLUMNS].values
+    scores = DataLoader.score_matrix(X)
+    cal = X[:, FEATURE_COLUMNS.index('Calories (kcal)')]
+    protein = X[:, FEATURE_COLUMNS.index('Protein (g)')]
+
+    best = None
+    for k in range(min_dishes, max_dishes + 1):
+        for rows in itertools.combinations(range(len(catalog)), k):
+            rows = list(rows)
+            if abs(cal[rows].sum() - calories) <= tolerance and protein[rows].sum() >= min_protein:
+                average = scores[rows].mean()
+                if best is None or average > best:
+                    best = average
+    return best
+
+
+def verify(df, rng, trials=100):
+    """Compare plan() with brute force on small catalogs
+
+    Catalogs are drawn with replacement, so duplicate rows give tied scores.
+    Returns the number of mismatches.
+    """
+    mismatches = 0
+    for trial in range(trials):
+        size = int(rng.integers(5, 22))
+        catalog = df.sample(size, replace=True, random_state=int(rng.integers(1 << 31))).reset_index(drop=True)
+        min_dishes = int(rng.integers(1, 4))
+        max_dishes = min_dishes + int(rng.integers(0, 3))
+        targets = (float(rng.uniform(200, 1500)), float(rng.uniform(0, 30)), float(rng.uniform(20, 200)),
+                   min_dishes, max_dishes)
+
+        expected = brute_force(catalog, *targets)
+        result = MealPlanner(catalog).plan(*targets)
+        got = result['average_score']
+
+        ok = (expected is None) == (got is None) and (got is None or abs(got - expected) < 1e-9)
+        if ok and got is not None:
+            # The returned rows must themselves meet the targets and give that average
+            plan = catalog.iloc[result['rows']]
+            calories, min_protein, tolerance = targets[:3]
+            ok = (min_dishes <= len(plan) <= max_dishes
+                  and abs(plan['Calories (kcal)'].sum() - calories) <= tolerance
+                  and plan['Protein (g)'].sum() >= min_protein
+                  and abs(DataLoader.score_matrix(plan[FEATURE_COLUMNS].values).mean() - got) < 1e-9)
+        if not ok:
+            mismatches += 1
+            print(f"  ✗ trial {trial}: {size} dishes, targets {targets}: expected {expected}, got {got}")
+    return mismatches
+
+
+def main():
+    """Main execution"""
+    print_header("MEAL PLAN BENCHMARK")
+
+    loader = DataLoader()
+    df = loader.load()
+    rng = np.random.default_rng(RANDOM_STATE)
+
+    trials = 100
+    mismatches = verify(df, rng, trials)
+    print(f"{'✓' if mismatches == 0 else '❌'} Brute-force check: {trials - mismatches}/{trials} "
+          f"catalogs of 5-21 dishes match\n")
+
+    print("Target: 3-5 dishes, 1800 ± 100 kcal, ≥ 60 g protein\n")
+
+    print(f"{'dishes':>8} {'build ms':>10} {'search ms':>10} {'nodes':>8} "
+          f"{'pruned':>8} {'candidates':>11} {'avg score':>10}")
+    for size in (250, 1014, 5000, 20000):
+        catalog = df if size == len(df) else make_catalog(df, size, rng)
+
+        start = time.perf_counter()
+        planner = MealPlanner(catalog)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        result = planner.plan(1800, min_protein=60)
+        stats = result['stats']
+        pruned = stats['pruned_bound'] + stats['pruned_feasibility']
+        average = f"{result['average_score']:.2f}" if result['rows'] else 'none'
+        flag = ' (timed out)' if stats['timed_out'] else ''
+        print(f"{size:>8} {build_ms:>10.1f} {stats['elapsed_ms']:>10.1f} {stats['nodes']:>8} "
+              f"{pruned:>8} {stats['candidates']:>11} {average:>10}{flag}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
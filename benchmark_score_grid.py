@@ -0,0 +1,66 @@
+"""
+Score Grid Benchmark Script
+Validate the lookup grid against direct model and formula scoring
+Run: python benchmark_score_grid.py
+"""
+
+import time
+import numpy as np
+import joblib
+from data_loader import DataLoader
+from score_grid import ScoreGrid
+from config import MODEL_FILE, SCALER_FILE, RANDOM_STATE, SCORE_GRID_MAX_BATCH
+
+
+def print_header(text):
+    """Print formatted header"""
+    print("\n" + "=" * 80)
+    print(f"  {text}")
+    print("=" * 80)
+
+
+def direct_score(model, scaler, X):
+    """Reference path: scaler + model and the exact formula"""
+    prediction = np.clip(model.predict(scaler.transform(X)), 0, 100)
+    return prediction, DataLoader.score_matrix(X)
+
+
+def time_per_call(fn, X, repeats):
+    """Average wall time of fn(X) in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(X)
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    """Main execution"""
+    print_header("SCORE GRID BENCHMARK")
+
+    model = joblib.load(str(MODEL_FILE))
+    scaler = joblib.load(str(SCALER_FILE))
+    grid = ScoreGrid().build(model, scaler)
+    print(f"✓ Grid: {' × '.join(str(n) for n in grid.shape)} nodes, {grid.memory_bytes() / 1024:.1f} KB")
+
+    # Accuracy over uniform samples from the bounded domain
+    rng = np.random.default_rng(RANDOM_STATE)
+    X = rng.uniform(grid.low, grid.high, size=(100_000, len(grid.shape)))
+    grid_pred, grid_ref = grid.score(X)
+    direct_pred, direct_ref = direct_score(model, scaler, X)
+    print(f"\n📊 Max abs error (in range):")
+    print(f"  ├─ Prediction: {np.abs(grid_pred - direct_pred).max():.2e}")
+    print(f"  └─ Reference:  {np.abs(grid_ref - direct_ref).max():.2e}")
+
+    # Latency by batch size
+    print(f"\n{'batch':>8} {'direct ms':>12} {'grid ms':>12}")
+    for size, repeats in ((1, 2000), (100, 500), (256, 500), (1000, 200), (10_000, 20)):
+        batch = X[:size]
+        direct_ms = time_per_call(lambda b: direct_score(model, scaler, b), batch, repeats)
+        grid_ms = time_per_call(grid.score, batch, repeats)
+        print(f"{size:>8} {direct_ms:>12.4f} {grid_ms:>12.4f}")
+    print(f"\n'auto' backend uses the grid up to {SCORE_GRID_MAX_BATCH} rows")
+    print()
+
+
+if __name__ == "__main__":
+    main()
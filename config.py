@@ -23,11 +23,42 @@ FEATURE_COLUMNS = ['Calories (kcal)', 'Protein (g)', 'Carbohydrates (g)', 'Free
 TARGET_COLUMN = 'Nutritional_Score'
 DISH_NAME_COLUMN = 'Dish Name'
 
+# Full nutrient vector used for "dishes like this one" matching
+NUTRIENT_COLUMNS = [
+    'Calories (kcal)', 'Carbohydrates (g)', 'Protein (g)', 'Fats (g)',
+    'Free Sugar (g)', 'Fibre (g)', 'Sodium (mg)', 'Calcium (mg)',
+    'Iron (mg)', 'Vitamin C (mg)', 'Folate (µg)'
+]
+
+# Approximate nearest-neighbour index (product quantization)
+BUILD_ANN_INDEX = True
+ANN_SUBSPACES = 4
+ANN_CENTROIDS = 256  # codes fit in uint8
+SIMILARITY_BACKEND = 'auto'  # 'auto', 'ann' or 'exact'
+SIMILARITY_ANN_MIN_DISHES = 50_000  # 'auto' uses exact search below this size
+
+# Score lookup grid: (low, high, points) per feature in FEATURE_COLUMNS order.
+# Nodes land on every kink of calculate_score, so interpolation is exact in range.
+SCORE_GRID_AXES = [
+    (0, 500, 21),   # Calories (kcal), step 25
+    (0, 20, 21),    # Protein (g), step 1
+    (0, 80, 17),    # Carbohydrates (g), step 5
+    (0, 15, 16),    # Free Sugar (g), step 1
+]
+SCORE_BACKEND = 'auto'  # 'auto', 'grid' or 'direct'
+SCORE_GRID_MAX_BATCH = 256  # 'auto' scores larger batches directly
+
+# Meal-plan optimizer
+MEAL_PLAN_MAX_DISHES = 6
+MEAL_PLAN_TIME_BUDGET = 2.0  # seconds, also the cap for client requests
+MEAL_PLAN_BLOCK_SIZE = 64  # first-dish choices per search block
+
 # Model files
 MODEL_FILE = MODELS_DIR / 'linear_regression_model.joblib'
 SCALER_FILE = MODELS_DIR / 'scaler.joblib'
 FEATURES_FILE = MODELS_DIR / 'features.joblib'
 DISHES_FILE = MODELS_DIR / 'dishes.joblib'
+ANN_INDEX_FILE = MODELS_DIR / 'ann_index.joblib'
 
 # Ensure directories exist
 MODELS_DIR.mkdir(exist_ok=True)
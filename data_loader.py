@@ -60,6 +60,23 @@ class DataLoader:
         
         return min(100, max(0, score))
     
+    @staticmethod
+    def score_matrix(X):
+        """Vectorized calculate_score for an (n, 4) array in FEATURE_COLUMNS order"""
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        calories, protein, carbs, sugar = X.T
+        
+        protein_score = np.minimum(protein, 20) / 20 * 100
+        calorie_score = (1 - np.minimum(calories, 500) / 500) * 100
+        carb_score = np.where(
+            carbs < 30, carbs / 30 * 100,
+            np.where(carbs <= 50, 100, np.maximum(0, 100 - (carbs - 50) / 30 * 100))
+        )
+        sugar_score = (1 - np.minimum(sugar, 15) / 15) * 100
+        
+        score = protein_score * 0.35 + calorie_score * 0.25 + carb_score * 0.25 + sugar_score * 0.15
+        return np.clip(score, 0, 100)
+    
     def prepare_data(self):
         """Load and prepare data with target variable"""
         if self.df is None:
@@ -5,7 +5,8 @@ Train Linear Regression model and save it
 
 from data_loader import DataLoader
 from model_trainer import ModelTrainer
-from config import print_config
+from nn_index import NutrientIndex
+from config import print_config, BUILD_ANN_INDEX, ANN_INDEX_FILE
 
 
 def print_header(text):
@@ -46,6 +47,16 @@ def main():
     print_header("STEP 4: SAVING MODEL")
     trainer.save_model()
     
+    # Build similarity index over the full nutrient vector
+    if BUILD_ANN_INDEX:
+        print_header("STEP 5: BUILDING SIMILARITY INDEX")
+        index = NutrientIndex().fit(loader.df)
+        index.save()
+        print(f"✓ Index built: {len(index.codes)} dishes, {len(index.columns)} nutrients")
+        print(f"  ├─ Code size: {index.codes.shape[1]} bytes per dish")
+        print(f"  ├─ Memory: {index.memory_bytes() / 1024:.1f} KB")
+        print(f"  └─ Index saved: {ANN_INDEX_FILE.name}")
+    
     # Summary
     print_header("TRAINING COMPLETE ✅")
     print(f"\n✓ Model ready for predictions!")
@@ -0,0 +1,164 @@
+"""
+Meal Planner Module
+Branch-and-bound search for day plans that hit nutrient targets
+"""
+
+import bisect
+import time
+import numpy as np
+from data_loader import DataLoader
+from config import (FEATURE_COLUMNS, TARGET_COLUMN, MEAL_PLAN_MAX_DISHES, MEAL_PLAN_TIME_BUDGET,
+                    MEAL_PLAN_BLOCK_SIZE)
+
+
+class _Search:
+    """Targets, deadline and incumbent for one plan() call"""
+
+    def __init__(self, low, high, min_protein, deadline):
+        self.low = low
+        self.high = high
+        self.min_protein = min_protein
+        self.deadline = deadline
+        self.best_average = -np.inf
+        self.best_rows = None
+        self.timed_out = False
+
+
+class MealPlanner:
+    """Pick k distinct dishes maximizing average Nutritional_Score
+
+    Dishes are sorted by score so the next r dishes always bound the best
+    possible completion. Suffix tables of the r largest protein values and
+    the r largest/smallest calorie values prune subtrees that cannot reach the
+    targets, and the last dish is picked with one vectorized mask. The
+    search runs serially over blocks of first dishes, so results and stats
+    are deterministic.
+    """
+
+    def __init__(self, catalog, max_dishes=MEAL_PLAN_MAX_DISHES):
+        X = catalog[FEATURE_COLUMNS].values.astype(np.float64)
+        if TARGET_COLUMN in catalog:
+            scores = catalog[TARGET_COLUMN].values.astype(np.float64)
+        else:
+            scores = DataLoader.score_matrix(X)
+
+        self.max_dishes = max_dishes
+        self.order = np.argsort(-scores, kind='stable')
+        self.scores = scores[self.order]
+        self.calories = X[self.order, FEATURE_COLUMNS.index('Calories (kcal)')]
+        self.protein = X[self.order, FEATURE_COLUMNS.index('Protein (g)')]
+
+        self.score_cumsum = np.concatenate([[0.0], np.cumsum(self.scores)])
+        self.score_keys = -self.scores  # ascending, for searchsorted
+        self.top_protein = self._suffix_sums(self.protein, max_dishes, largest=True)
+        self.top_calories = self._suffix_sums(self.calories, max_dishes, largest=True)
+        self.bottom_calories = self._suffix_sums(self.calories, max_dishes, largest=False)
+
+    @staticmethod
+    def _suffix_sums(values, r, largest):
+        """out[k, i] = sum of the k largest (or smallest) of values[i:]"""
+        n = len(values)
+        out = np.full((r + 1, n + 1), -np.inf if largest else np.inf)
+        out[0] = 0.0
+        kept = []
+        for i in range(n - 1, -1, -1):
+            bisect.insort(kept, -values[i] if largest else values[i])
+            del kept[r:]
+            sums = np.cumsum(kept)
+            out[1:len(kept) + 1, i] = -sums if largest else sums
+        return out
+
+    def plan(self, calories, min_protein=0.0, calorie_tolerance=100.0, min_dishes=3, max_dishes=5,
+             time_budget=MEAL_PLAN_TIME_BUDGET):
+        """Search for the best plan
+
+        Returns a dict with catalog row positions (`rows`, empty if nothing
+        fits), `average_score` and search `stats`. When the time budget runs
+        out the best plan found so far is returned with `optimal` False.
+        """
+        if not 1 <= min_dishes <= max_dishes <= self.max_dishes:
+            raise ValueError(f"Dish count must satisfy 1 <= min_dishes <= max_dishes <= {self.max_dishes}")
+        if calorie_tolerance < 0:
+            raise ValueError("calorie_tolerance must not be negative")
+
+        start = time.perf_counter()
+        search = _Search(calories - calorie_tolerance, calories + calorie_tolerance, min_protein,
+                         start + time_budget)
+
+        # Larger plans have more slack to hit the targets, so they run first
+        # within each block and seed a strong incumbent early
+        blocks = [(k, first)
+                 for first in range(0, len(self.scores), MEAL_PLAN_BLOCK_SIZE)
+                 for k in range(max_dishes, min_dishes - 1, -1)
+                 if first <= len(self.scores) - k]
+        results = [self._search_block(search, k, first) for k, first in blocks]
+
+        stats = {key: sum(r[key] for r in results) for key in ('nodes', 'pruned_bound', 'pruned_feasibility', 'candidates')}
+        stats.update({
+            'catalog_size': len(self.scores),
+            'blocks': len(blocks),
+            'elapsed_ms': (time.perf_counter() - start) * 1000,
+            'timed_out': search.timed_out,
+            'optimal': not search.timed_out,
+        })
+
+        rows = [] if search.best_rows is None else self.order[search.best_rows].tolist()
+        average = None if search.best_rows is None else float(search.best_average)
+        return {'rows': rows, 'average_score': average, 'stats': stats}
+
+    def _search_block(self, search, k, first):
+        """Explore plans of k dishes whose first dish lies in one block"""
+        stats = {'nodes': 0, 'pruned_bound': 0, 'pruned_feasibility': 0, 'candidates': 0}
+        stop = min(first + MEAL_PLAN_BLOCK_SIZE, len(self.scores) - k + 1)
+        self._expand(search, stats, k, first, stop, [], 0.0, 0.0, 0.0)
+        return stats
+
+    def _expand(self, search, stats, k, i, stop, chosen, score, cal, protein):
+        """Try each dish in [i, stop) as the next pick of a k-dish plan"""
+        r = k - len(chosen)
+        if search.timed_out or time.perf_counter() > search.deadline:
+            search.timed_out = True
+            return
+
+        if r == 1:
+            # Scores are sorted, so the first dish that fits is the best one,
+            # and only dishes scoring above the incumbent's need are worth a look
+            need = search.best_average * k - score
+            stop = min(stop, int(np.searchsorted(self.score_keys, -need, side='left')))
+            if stop <= i:
+                stats['pruned_bound'] += 1
+                return
+            stats['candidates'] += stop - i
+            fits = ((self.calories[i:stop] >= search.low - cal)
+                    & (self.calories[i:stop] <= search.high - cal)
+                    & (self.protein[i:stop] >= search.min_protein - protein))
+            if fits.any():
+                j = i + int(np.argmax(fits))
+                average = (score + self.scores[j]) / k
+                if average > search.best_average:
+                    search.best_average = average
+                    search.best_rows = chosen + [j]
+            return
+
+        for j in range(i, stop):
+            stats['nodes'] += 1
+
+            # Every later j has a smaller or equal bound, as do its suffix sums
+            if (score + self.score_cumsum[j + r] - self.score_cumsum[j]) / k <= search.best_average:
+                stats['pruned_bound'] += 1
+                return
+            if (protein + self.top_protein[r, j] < search.min_protein
+                    or cal + self.top_calories[r, j] < search.low):
+                stats['pruned_feasibility'] += 1
+                return
+
+            next_cal = cal + self.calories[j]
+            next_protein = protein + self.protein[j]
+            if (next_protein + self.top_protein[r - 1, j + 1] < search.min_protein
+                    or next_cal + self.top_calories[r - 1, j + 1] < search.low
+                    or next_cal + self.bottom_calories[r - 1, j + 1] > search.high):
+                stats['pruned_feasibility'] += 1
+                continue
+
+            self._expand(search, stats, k, j + 1, len(self.scores) - r + 2, chosen + [j],
+                         score + self.scores[j], next_cal, next_protein)
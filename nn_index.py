@@ -0,0 +1,180 @@
+"""
+Nearest-Neighbour Index Module
+Approximate "dishes like this one" search over the full nutrient vector
+"""
+
+import numpy as np
+import pandas as pd
+import hashlib
+import joblib
+from pathlib import Path
+from sklearn.cluster import KMeans
+from config import (NUTRIENT_COLUMNS, ANN_SUBSPACES, ANN_CENTROIDS, ANN_INDEX_FILE, RANDOM_STATE,
+                    SIMILARITY_BACKEND, SIMILARITY_ANN_MIN_DISHES)
+
+
+def data_fingerprint(X):
+    """Hash of the raw nutrient matrix, used to detect a stale saved index"""
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    return hashlib.sha256(repr(X.shape).encode() + X.tobytes()).hexdigest()
+
+
+class ExactNutrientIndex:
+    """Brute-force search over standardized nutrient vectors
+
+    Used when no approximate index has been built (or it no longer matches
+    the dataset), and as the ground truth in benchmark_ann.py.
+    """
+
+    def __init__(self):
+        self.columns = list(NUTRIENT_COLUMNS)
+        self.mean = None
+        self.scale = None
+        self.fingerprint = None
+        self.vectors = None
+
+    def standardize(self, X):
+        """Standardize raw nutrient values (missing values map to the mean)"""
+        if isinstance(X, pd.DataFrame):
+            X = X[self.columns].values
+        X = np.atleast_2d(np.asarray(X, dtype=np.float32))
+        Z = (X - self.mean) / self.scale
+        return np.nan_to_num(Z, nan=0.0).astype(np.float32)
+
+    def _fit_scaling(self, X):
+        """Learn per-nutrient mean and scale, return the raw float32 matrix"""
+        if isinstance(X, pd.DataFrame):
+            X = X[self.columns].values
+        X = np.asarray(X, dtype=np.float32)
+
+        self.fingerprint = data_fingerprint(X)
+        self.mean = np.nanmean(X, axis=0)
+        scale = np.nanstd(X, axis=0)
+        self.scale = np.where(scale > 0, scale, 1.0).astype(np.float32)
+        return X
+
+    def fit(self, X):
+        """Store the standardized vector of every dish"""
+        self.vectors = self.standardize(self._fit_scaling(X))
+        return self
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def _top_k(self, dists, k, exclude):
+        """Sorted (indices, distances) of the k smallest squared distances"""
+        if exclude is not None:
+            dists[exclude] = np.inf
+
+        k = min(k, len(dists) - (exclude is not None))
+        idx = np.argpartition(dists, k - 1)[:k] if k < len(dists) else np.arange(len(dists))
+        idx = idx[np.argsort(dists[idx])]
+        return idx, np.sqrt(dists[idx])
+
+    def query(self, x, k=5, exclude=None):
+        """Return (row indices, exact distances) of the k nearest dishes"""
+        if self.vectors is None:
+            raise RuntimeError("Index is empty. Call fit() first.")
+
+        z = self.standardize(x)[0]
+        return self._top_k(((self.vectors - z) ** 2).sum(axis=1), k, exclude)
+
+
+class NutrientIndex(ExactNutrientIndex):
+    """Product-quantization index over standardized nutrient vectors
+
+    Each dish vector is split into sub-vectors and every sub-vector is
+    replaced by the id of its nearest k-means centroid, so a dish is stored
+    as a handful of uint8 codes. Queries use asymmetric distance computation:
+    the query stays exact and distances are summed from per-subspace tables.
+    """
+
+    def __init__(self, n_subspaces=ANN_SUBSPACES, n_centroids=ANN_CENTROIDS):
+        if not 1 <= n_centroids <= 256:
+            raise ValueError("n_centroids must be between 1 and 256 to fit uint8 codes")
+        super().__init__()
+        self.n_subspaces = n_subspaces
+        self.n_centroids = n_centroids
+        self.splits = None
+        self.codebooks = None
+        self.codes = None
+
+    def fit(self, X):
+        """Learn codebooks and encode every dish"""
+        Z = self.standardize(self._fit_scaling(X))
+
+        # Contiguous column groups, one codebook per group
+        n_sub = min(self.n_subspaces, Z.shape[1])
+        self.splits = [(int(c[0]), int(c[-1]) + 1) for c in np.array_split(np.arange(Z.shape[1]), n_sub)]
+        n_clusters = min(self.n_centroids, len(Z))
+
+        self.codebooks = np.zeros((n_sub, n_clusters, max(end - start for start, end in self.splits)), dtype=np.float32)
+        self.codes = np.zeros((len(Z), n_sub), dtype=np.uint8)
+        for s, (start, end) in enumerate(self.splits):
+            kmeans = KMeans(n_clusters=n_clusters, n_init=1, random_state=RANDOM_STATE)
+            self.codes[:, s] = kmeans.fit_predict(Z[:, start:end])
+            self.codebooks[s, :, :end - start] = kmeans.cluster_centers_
+
+        return self
+
+    def _distance_tables(self, z):
+        """Squared distance from each query sub-vector to every centroid"""
+        tables = np.empty(self.codebooks.shape[:2], dtype=np.float32)
+        for s, (start, end) in enumerate(self.splits):
+            diff = self.codebooks[s, :, :end - start] - z[start:end]
+            tables[s] = (diff ** 2).sum(axis=1)
+        return tables
+
+    def query(self, x, k=5, exclude=None):
+        """Return (row indices, approximate distances) of the k nearest dishes
+
+        `x` holds raw nutrient values in NUTRIENT_COLUMNS order. `exclude`
+        drops one row index, e.g. the query dish itself.
+        """
+        if self.codes is None:
+            raise RuntimeError("Index is empty. Call fit() or load() first.")
+
+        z = self.standardize(x)[0]
+        tables = self._distance_tables(z)
+        dists = tables[np.arange(len(self.splits)), self.codes].sum(axis=1)
+        return self._top_k(dists, k, exclude)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def memory_bytes(self):
+        """Size of the stored codes and codebooks"""
+        return self.codes.nbytes + self.codebooks.nbytes + self.mean.nbytes + self.scale.nbytes
+
+    def save(self, path=ANN_INDEX_FILE):
+        """Persist the index with joblib"""
+        joblib.dump(self, str(path))
+
+    @staticmethod
+    def load(path=ANN_INDEX_FILE):
+        """Load a saved index"""
+        return joblib.load(str(path))
+
+
+def load_similarity_index(df, path=ANN_INDEX_FILE, backend=SIMILARITY_BACKEND):
+    """Similarity search for df according to backend
+
+    'exact' always searches every dish. 'ann' uses the saved PQ index, falling
+    back to exact search if it is missing or was built from different data.
+    'auto' uses 'ann' only for catalogs of SIMILARITY_ANN_MIN_DISHES or more,
+    since exact search is faster and exact below that size.
+    """
+    if backend not in ('auto', 'ann', 'exact'):
+        raise ValueError(f"Unknown similarity backend: {backend}")
+    if backend == 'auto':
+        backend = 'ann' if len(df) >= SIMILARITY_ANN_MIN_DISHES else 'exact'
+
+    if backend == 'ann':
+        if path is None or not Path(path).exists():
+            print('Warning: Similarity index not found. Run training (main.py) first. Using exact search.')
+        else:
+            index = NutrientIndex.load(path)
+            if getattr(index, 'fingerprint', None) == data_fingerprint(df[NUTRIENT_COLUMNS].values):
+                return index
+            print('Warning: Similarity index does not match the dataset. Re-run training (main.py). Using exact search.')
+    return ExactNutrientIndex().fit(df)
@@ -0,0 +1,95 @@
+"""
+Score Grid Module
+Precomputed lookup grid for low-latency model and formula scoring
+"""
+
+import itertools
+import numpy as np
+from data_loader import DataLoader
+from config import SCORE_GRID_AXES
+
+
+class ScoreGrid:
+    """Dense float32 grids of model prediction and formula score
+
+    Both grids cover the bounded feature domain in SCORE_GRID_AXES and are
+    read back with multilinear interpolation. Rows outside the domain fall
+    back to direct computation with the model and DataLoader.score_matrix.
+    """
+
+    def __init__(self, axes=SCORE_GRID_AXES):
+        self.axes = [np.linspace(low, high, points, dtype=np.float64) for low, high, points in axes]
+        self.low = np.array([a[0] for a in self.axes])
+        self.high = np.array([a[-1] for a in self.axes])
+        self.step = np.array([a[1] - a[0] for a in self.axes])
+        self.shape = tuple(len(a) for a in self.axes)
+        self.model = None
+        self.scaler = None
+        self.prediction_grid = None
+        self.reference_grid = None
+
+    def build(self, model, scaler):
+        """Evaluate the model and the formula at every grid node"""
+        self.model = model
+        self.scaler = scaler
+
+        nodes = np.stack(np.meshgrid(*self.axes, indexing='ij'), axis=-1).reshape(-1, len(self.axes))
+        self.prediction_grid = model.predict(scaler.transform(nodes)).astype(np.float32).reshape(self.shape)
+        self.reference_grid = DataLoader.score_matrix(nodes).astype(np.float32).reshape(self.shape)
+        self._prepare()
+        return self
+
+    def _prepare(self):
+        """Flat (nodes, 2) table and corner offsets used by _interpolate"""
+        self._table = np.stack([self.prediction_grid.ravel(), self.reference_grid.ravel()], axis=1)
+        self._strides = np.array([int(np.prod(self.shape[d + 1:])) for d in range(len(self.shape))])
+        self._corners = np.array(list(itertools.product((0, 1), repeat=len(self.shape))))
+        self._offsets = self._corners @ self._strides
+
+    def _interpolate(self, X):
+        """Multilinear interpolation of both grids at in-range rows of X"""
+        pos = (X - self.low) / self.step
+        cell = np.minimum(pos.astype(np.intp), np.array(self.shape) - 2)
+        frac = pos - cell
+        base = cell @ self._strides
+
+        # Corner weights as an outer product over axes, in self._corners order
+        weights = np.stack([1 - frac[:, 0], frac[:, 0]])
+        for d in range(1, frac.shape[1]):
+            weights = (weights[:, None, :] * np.stack([1 - frac[:, d], frac[:, d]])[None]).reshape(-1, len(X))
+
+        values = self._table[base[None, :] + self._offsets[:, None]]
+        return np.einsum('cn,cnk->nk', weights, values)
+
+    def score(self, X):
+        """Return (predicted scores, reference scores) for an (n, 4) array
+
+        Predictions are clamped to 0-100 like the direct model path. Raises
+        ValueError for NaN or infinite inputs.
+        """
+        if self.prediction_grid is None:
+            raise RuntimeError("Grid is empty. Call build() first.")
+
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        if not np.all(np.isfinite(X)):
+            raise ValueError("Inputs must be finite numbers")
+        in_range = np.all((X >= self.low) & (X <= self.high), axis=1)
+
+        if in_range.all():
+            out = self._interpolate(X)
+            return np.clip(out[:, 0], 0, 100), out[:, 1]
+
+        prediction = np.empty(len(X))
+        reference = np.empty(len(X))
+        if in_range.any():
+            out = self._interpolate(X[in_range])
+            prediction[in_range], reference[in_range] = out[:, 0], out[:, 1]
+        outside = X[~in_range]
+        prediction[~in_range] = self.model.predict(self.scaler.transform(outside))
+        reference[~in_range] = DataLoader.score_matrix(outside)
+
+        return np.clip(prediction, 0, 100), reference
+
+    def memory_bytes(self):
+        """Size of both lookup grids"""
+        return self.prediction_grid.nbytes + self.reference_grid.nbytes
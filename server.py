@@ -9,6 +9,11 @@ import joblib
 import pandas as pd
 import numpy as np
 import os
+from config import NUTRIENT_COLUMNS, FEATURE_COLUMNS, SCORE_BACKEND, SCORE_GRID_MAX_BATCH, MEAL_PLAN_TIME_BUDGET
+from data_loader import DataLoader
+from meal_planner import MealPlanner
+from nn_index import NutrientIndex, load_similarity_index
+from score_grid import ScoreGrid
 
 # serve static frontend from frontend/ folder
 app = Flask(__name__, static_folder='frontend', static_url_path='')
@@ -30,6 +35,11 @@ FEATURES_PATHS = [
     os.path.join('models', 'features.joblib'),
     os.path.join('outputs', 'models', 'features.joblib')
 ]
+ANN_INDEX_PATHS = [
+    'ann_index.joblib',
+    os.path.join('models', 'ann_index.joblib'),
+    os.path.join('outputs', 'models', 'ann_index.joblib')
+]
 DATASET_PATHS = [
     'Indian_Food_Nutrition_Processed.csv',
     'Indian_Food_Nutrition_Predicted.csv',
@@ -41,6 +51,9 @@ model = None
 scaler = None
 FEATURES = None
 DF = None
+ANN_INDEX = None
+SCORE_GRID = None
+MEAL_PLANNER = None
 
 
 def _locate(paths):
@@ -58,6 +71,8 @@ if model_file and scaler_file and features_file:
     model = joblib.load(model_file)
     scaler = joblib.load(scaler_file)
     FEATURES = joblib.load(features_file)
+    # score lookup grid, built from the loaded model so the two never disagree
+    SCORE_GRID = ScoreGrid().build(model, scaler)
 else:
     # attempt to load from current project outputs
     print('Warning: Model/scaler/features not found in expected locations. Please run training (main.py) first and ensure model files are saved.')
@@ -66,9 +81,16 @@ else:
 dataset_file = _locate(DATASET_PATHS)
 if dataset_file:
     DF = pd.read_csv(dataset_file)
+    if 'Nutritional_Score' not in DF:
+        DF['Nutritional_Score'] = DataLoader.score_matrix(DF[FEATURE_COLUMNS].values)
+    MEAL_PLANNER = MealPlanner(DF)
 else:
     print('Warning: Dataset CSV not found. Some API endpoints will be limited.')
 
+# similarity search over the full nutrient vector (SIMILARITY_BACKEND picks PQ index or exact)
+if DF is not None:
+    ANN_INDEX = load_similarity_index(DF, _locate(ANN_INDEX_PATHS))
+
 
 def calculate_nutritional_score_row(row):
     # fallback score from data if available
@@ -90,24 +112,45 @@ def interpret_score(score):
         return 'Very Poor'
 
 
+def parse_inputs(data):
+    values = [float(data.get(key, 0)) for key in ('calories', 'protein', 'carbs', 'sugar')]
+    if not np.all(np.isfinite(values)):
+        raise ValueError('nutrient values must be finite numbers')
+    return values
+
+
+SCORE_BACKENDS = ('auto', 'grid', 'direct')
+
+
+# returns (predicted, reference, backend used) for an (n, 4) array
+def score_inputs(X, backend=None):
+    backend = backend or SCORE_BACKEND
+    if backend == 'auto':
+        backend = 'grid' if len(X) <= SCORE_GRID_MAX_BATCH else 'direct'
+    if backend == 'grid' and SCORE_GRID is not None:
+        prediction, reference = SCORE_GRID.score(X)
+        return prediction, reference, 'grid'
+    prediction = np.clip(model.predict(scaler.transform(X)), 0, 100)
+    return prediction, DataLoader.score_matrix(X), 'direct'
+
+
 @app.route('/api/predict', methods=['POST'])
 def api_predict():
     data = request.get_json(force=True)
     try:
-        calories = float(data.get('calories', 0))
-        protein = float(data.get('protein', 0))
-        carbs = float(data.get('carbs', 0))
-        sugar = float(data.get('sugar', 0))
+        calories, protein, carbs, sugar = parse_inputs(data)
     except Exception as e:
         return jsonify({'error': 'invalid input', 'detail': str(e)}), 400
 
     if model is None or scaler is None:
         return jsonify({'error': 'model not loaded. Run training and place model files in project root or outputs/models.'}), 500
 
+    if (data.get('backend') or SCORE_BACKEND) not in SCORE_BACKENDS:
+        return jsonify({'error': 'invalid input', 'detail': f"backend must be one of {', '.join(SCORE_BACKENDS)}"}), 400
+
     X_input = np.array([[calories, protein, carbs, sugar]])
-    X_scaled = scaler.transform(X_input)
-    score = float(model.predict(X_scaled)[0])
-    score = max(0.0, min(100.0, score))
+    prediction, reference, backend = score_inputs(X_input, data.get('backend'))
+    score = float(prediction[0])
     category = interpret_score(score)
 
     # find top 2 matches using Euclidean distance on raw features
@@ -130,7 +173,37 @@ def api_predict():
             }
             matches.append(row_out)
 
-    return jsonify({'score': round(score, 4), 'category': category, 'matches': matches})
+    return jsonify({
+        'score': round(score, 4),
+        'reference_score': round(float(reference[0]), 4),
+        'category': category,
+        'backend': backend,
+        'matches': matches
+    })
+
+
+@app.route('/api/predict/batch', methods=['POST'])
+def api_predict_batch():
+    data = request.get_json(force=True)
+    try:
+        items = data.get('items', [])
+        X_input = np.array([parse_inputs(item) for item in items], dtype=float).reshape(-1, 4)
+    except Exception as e:
+        return jsonify({'error': 'invalid input', 'detail': str(e)}), 400
+
+    if model is None or scaler is None:
+        return jsonify({'error': 'model not loaded. Run training and place model files in project root or outputs/models.'}), 500
+    if (data.get('backend') or SCORE_BACKEND) not in SCORE_BACKENDS:
+        return jsonify({'error': 'invalid input', 'detail': f"backend must be one of {', '.join(SCORE_BACKENDS)}"}), 400
+    if len(X_input) == 0:
+        return jsonify({'results': []})
+
+    prediction, reference, backend = score_inputs(X_input, data.get('backend'))
+    results = [
+        {'score': round(float(p), 4), 'reference_score': round(float(r), 4), 'category': interpret_score(p)}
+        for p, r in zip(prediction, reference)
+    ]
+    return jsonify({'backend': backend, 'results': results})
 
 
 @app.route('/api/search', methods=['GET'])
@@ -144,6 +217,88 @@ def api_search():
     return jsonify({'results': res.to_dict(orient='records')})
 
 
+@app.route('/api/similar', methods=['GET'])
+def api_similar():
+    dish = request.args.get('dish', '').strip().lower()
+    try:
+        k = int(request.args.get('k', 5))
+    except ValueError as e:
+        return jsonify({'error': 'invalid input', 'detail': str(e)}), 400
+    if DF is None:
+        return jsonify({'error': 'dataset not loaded'}), 500
+    if not dish:
+        return jsonify({'results': []})
+
+    hits = np.flatnonzero(DF['Dish Name'].str.lower().str.contains(dish, na=False, regex=False).values)
+    if len(hits) == 0:
+        return jsonify({'error': 'dish not found'}), 404
+
+    i = int(hits[0])
+    idx, dists = ANN_INDEX.query(DF[NUTRIENT_COLUMNS].values[i], k=max(1, min(k, 50)), exclude=i)
+    results = []
+    for j, dist in zip(idx, dists):
+        row = DF.iloc[int(j)]
+        row_out = {col: float(row[col]) if pd.notna(row[col]) else None for col in NUTRIENT_COLUMNS}
+        row_out['Dish Name'] = row['Dish Name']
+        row_out['distance'] = float(dist)
+        results.append(row_out)
+
+    backend = 'ann' if isinstance(ANN_INDEX, NutrientIndex) else 'exact'
+    return jsonify({'dish': DF.iloc[i]['Dish Name'], 'backend': backend, 'results': results})
+
+
+@app.route('/api/meal-plan', methods=['POST'])
+def api_meal_plan():
+    data = request.get_json(force=True)
+    try:
+        calories = float(data.get('calories', 1800))
+        min_protein = float(data.get('min_protein', 0))
+        tolerance = float(data.get('calorie_tolerance', 100))
+        min_dishes = data.get('min_dishes', 3)
+        max_dishes = data.get('max_dishes', 5)
+        time_budget = float(data.get('time_budget_ms', MEAL_PLAN_TIME_BUDGET * 1000)) / 1000
+    except Exception as e:
+        return jsonify({'error': 'invalid input', 'detail': str(e)}), 400
+
+    if not all(np.isfinite([calories, min_protein, tolerance, time_budget])):
+        return jsonify({'error': 'invalid input', 'detail': 'targets and time budget must be finite numbers'}), 400
+    if tolerance < 0:
+        return jsonify({'error': 'invalid input', 'detail': 'calorie_tolerance must not be negative'}), 400
+    if not all(isinstance(n, int) and not isinstance(n, bool) for n in (min_dishes, max_dishes)):
+        return jsonify({'error': 'invalid input', 'detail': 'min_dishes and max_dishes must be integers'}), 400
+    time_budget = min(max(time_budget, 0.0), MEAL_PLAN_TIME_BUDGET)
+
+    if MEAL_PLANNER is None:
+        return jsonify({'error': 'dataset not loaded'}), 500
+
+    try:
+        result = MEAL_PLANNER.plan(calories, min_protein, tolerance, min_dishes, max_dishes, time_budget)
+    except ValueError as e:
+        return jsonify({'error': 'invalid input', 'detail': str(e)}), 400
+
+    plan = DF.iloc[result['rows']]
+    dishes = [
+        {
+            'Dish Name': row['Dish Name'],
+            'Calories (kcal)': float(row['Calories (kcal)']),
+            'Protein (g)': float(row['Protein (g)']),
+            'Carbohydrates (g)': float(row['Carbohydrates (g)']),
+            'Free Sugar (g)': float(row['Free Sugar (g)']),
+            'Nutritional_Score': float(row['Nutritional_Score'])
+        }
+        for _, row in plan.iterrows()
+    ]
+    totals = {col: round(float(plan[col].sum()), 2) for col in FEATURE_COLUMNS}
+    average = result['average_score']
+
+    return jsonify({
+        'dishes': dishes,
+        'totals': totals,
+        'average_score': None if average is None else round(average, 4),
+        'stats': result['stats']
+    })
+
+
 # Serve static frontend
 @app.route('/')
 def index():